@@ -1,6 +1,8 @@
 """Utilities for dealing with .strings files"""
 
+import concurrent.futures
 import os
+from collections.abc import Iterator, Mapping
 
 from dotstrings.parser import load, loads, load_dict, loads_dict
 from dotstrings.dot_strings_entry import DotStringsEntry
@@ -32,7 +34,7 @@ def strings_file_path(strings_folder: str, language: str, table_name: str) -> st
 
     :returns: The path to the strings file
     """
-    return os.path.join(language_folder_path(strings_folder, language), f"{table_name}.strings")
+    return os.path.join(strings_folder, f"{language}.lproj", f"{table_name}.strings")
 
 
 def stringsdict_file_path(stringsdict_folder: str, language: str, table_name: str) -> str:
@@ -45,9 +47,24 @@ def stringsdict_file_path(stringsdict_folder: str, language: str, table_name: st
 
     :returns: The path to the strings file
     """
-    return os.path.join(
-        language_folder_path(stringsdict_folder, language), f"{table_name}.stringsdict"
-    )
+    return os.path.join(stringsdict_folder, f"{language}.lproj", f"{table_name}.stringsdict")
+
+
+def language_folders(strings_folder: str) -> Iterator[tuple[str, str]]:
+    """Find all the language folders in a folder.
+
+    This looks for *.lproj folders and yields the language code along with the
+    folder path, so that callers don't need to rebuild the path themselves.
+
+    :param strings_folder: The location of the strings folder (which contains
+                           all the *.lproj folders)
+
+    :returns: An iterator of (language code, folder path) tuples
+    """
+    with os.scandir(strings_folder) as folder_entries:
+        for folder_entry in folder_entries:
+            if folder_entry.name.endswith(".lproj"):
+                yield folder_entry.name.removesuffix(".lproj"), folder_entry.path
 
 
 def languages_in_folder(strings_folder: str) -> set[str]:
@@ -60,9 +77,7 @@ def languages_in_folder(strings_folder: str) -> set[str]:
 
     :returns: A set containing all the languages.
     """
-    languages = os.listdir(strings_folder)
-    languages = [language for language in languages if language.endswith(".lproj")]
-    return {language.replace(".lproj", "") for language in languages}
+    return {language for language, _ in language_folders(strings_folder)}
 
 
 def load_table(strings_folder: str, language: str, table_name: str) -> list[LocalizedString]:
@@ -83,28 +98,64 @@ def load_table(strings_folder: str, language: str, table_name: str) -> list[Loca
     )
 
 
-def load_language_tables(strings_folder: str, language: str) -> dict[str, list[LocalizedString]]:
+class LazyTables(Mapping):
+    """A mapping of table names to strings which parses each table on demand.
+
+    Tables are only read from disk the first time they are accessed, then
+    cached, so consumers that only touch one or two tables don't pay for
+    parsing the entire language folder.
+
+    :param strings_folder: The location of the strings folder (which contains
+                           all the *.lproj folders)
+    :param language: The language code the tables are in
+    :param table_names: The names of the tables available on disk
+    """
+
+    def __init__(self, strings_folder: str, language: str, table_names: set[str]) -> None:
+        self.strings_folder = strings_folder
+        self.language = language
+        self._table_names = table_names
+        self._loaded: dict[str, list[LocalizedString]] = {}
+
+    def __getitem__(self, table_name: str) -> list[LocalizedString]:
+        if table_name not in self._table_names:
+            raise KeyError(table_name)
+
+        if table_name not in self._loaded:
+            self._loaded[table_name] = load_table(self.strings_folder, self.language, table_name)
+
+        return self._loaded[table_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table_names)
+
+    def __len__(self) -> int:
+        return len(self._table_names)
+
+
+def load_language_tables(strings_folder: str, language: str) -> Mapping[str, list[LocalizedString]]:
     """Load the .strings tables for a given language
 
+    The tables are loaded lazily: nothing is parsed until a table is accessed.
+
     :param strings_folder: The location of the strings folder (which contains
                            all the *.lproj folders)
     :param language: The language code to load
 
-    :returns: A dictionary of results. The key is the table, the value is the
+    :returns: A mapping of results. The key is the table, the value is the
               list of strings in the table
     """
 
     language_folder = language_folder_path(strings_folder, language)
 
-    results = {}
+    table_names = set()
 
-    for table in os.listdir(language_folder):
-        if not table.endswith(".strings"):
-            continue
-        table_name = table.replace(".strings", "")
-        results[table_name] = load_table(strings_folder, language, table_name)
+    with os.scandir(language_folder) as folder_entries:
+        for folder_entry in folder_entries:
+            if folder_entry.name.endswith(".strings"):
+                table_names.add(folder_entry.name.removesuffix(".strings"))
 
-    return results
+    return LazyTables(strings_folder, language, table_names)
 
 
 def load_all_strings(strings_folder: str) -> LocalizedBundle:
@@ -117,12 +168,26 @@ def load_all_strings(strings_folder: str) -> LocalizedBundle:
     :returns: A LocalizedBundle containing the results
     """
 
-    languages = languages_in_folder(strings_folder)
+    folders = sorted(language_folders(strings_folder))
+
+    # Loading is I/O bound, so rather than reading each table in turn, flatten
+    # the bundle into (language, table) pairs and load them on a thread pool.
+    jobs = []
+
+    for language, language_folder in folders:
+        with os.scandir(language_folder) as folder_entries:
+            for folder_entry in folder_entries:
+                if not folder_entry.name.endswith(".strings"):
+                    continue
+                jobs.append((language, folder_entry.name.removesuffix(".strings")))
+
+    results: dict[str, dict[str, list[LocalizedString]]] = {language: {} for language, _ in folders}
 
-    results = {}
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        tables = executor.map(lambda job: load_table(strings_folder, job[0], job[1]), jobs)
 
-    for language in sorted(languages):
-        results[language] = load_language_tables(strings_folder, language)
+        for (language, table_name), strings in zip(jobs, tables):
+            results[language][table_name] = strings
 
     return LocalizedBundle(results)
 
@@ -135,8 +200,8 @@ def normalize(
 ) -> None:
     """Load in the specified .strings table, normalize it, and write it back out.
 
-    Normalizing consists of sorting by key, then comments, and (usually)
-    deduplicating before writing back out.
+    Normalizing consists of sorting by key (duplicates keep their original
+    relative order) and (usually) deduplicating before writing back out.
 
     :param strings_path: The location of the strings file
     :param output_path: The location to write the sorted file to. If None, it
@@ -151,15 +216,21 @@ def normalize(
     """
 
     entries = load(strings_path)
-    entries.sort(key=lambda x: [x.key] + x.comments)
+
+    # The sort is stable, so sorting on the key alone is enough for the
+    # adjacent dedup below; it also avoids building a throwaway
+    # [key, *comments] list for every entry.
+    entries.sort(key=lambda x: x.key)
 
     deduped_entries = [entries[0]]
+    seen_comments = set(entries[0].comments)
 
     for entry in entries[1:]:
 
         # If the keys are different, just add to the list and move on
         if deduped_entries[-1].key != entry.key:
             deduped_entries.append(entry)
+            seen_comments = set(entry.comments)
             continue
 
         # If we have duplicate keys but the values don't match, that's an
@@ -167,17 +238,21 @@ def normalize(
         if deduped_entries[-1].value != entry.value or not remove_duplicates:
             raise DotStringsException(f"Found duplicate strings with key: {entry.key}")
 
-        deduped_entries[-1].comments.extend(entry.comments)
+        # Only carry over comments we haven't already collected for this key,
+        # so the merged list never grows just to be deduplicated later
+        for comment in entry.comments:
+            if comment not in seen_comments:
+                seen_comments.add(comment)
+                deduped_entries[-1].comments.append(comment)
 
     if sort_comments:
         for entry in deduped_entries:
-            entry.comments = list(set(entry.comments))
-            entry.comments.sort()
+            entry.comments = sorted(set(entry.comments))
 
     if output_path is None:
         output_path = strings_path
 
+    contents = "\n\n".join(entry.strings_format() for entry in deduped_entries) + "\n\n"
+
     with open(output_path, "w", encoding="utf-8") as strings_file:
-        for entry in deduped_entries:
-            strings_file.write(entry.strings_format())
-            strings_file.write("\n\n")
+        strings_file.write(contents)
@@ -1,5 +1,7 @@
 """Base types for the dotstrings library."""
 
+import sys
+
 
 class DotStringsEntry:
     """Represents a .strings entry.
@@ -9,14 +11,20 @@ class DotStringsEntry:
     :param comments: Any comments associated with the entry
     """
 
+    __slots__ = ("key", "value", "comments", "_hash")
+
     key: str
     value: str
     comments: list[str]
+    _hash: int | None
 
     def __init__(self, key: str, value: str, comments: list[str]) -> None:
-        self.key = key
-        self.value = value
-        self.comments = comments
+        # Keys, values and comments repeat across every language in a bundle,
+        # so interning collapses the copies down to a single string each.
+        self.key = sys.intern(key)
+        self.value = sys.intern(value)
+        self.comments = [sys.intern(comment) for comment in comments]
+        self._hash = None
 
     def strings_format(self) -> str:
         """Return the entry as would be formatted in a .strings file
@@ -28,27 +36,58 @@ class DotStringsEntry:
         if len(self.comments) == 0:
             return key_value
 
-        if len(self.comments) == 1:
-            return f"/* {self.comments[0]} */\n{key_value}"
+        comment_lines = [f"/* {self.comments[0]}"]
+        comment_lines += [f"   {comment}" for comment in self.comments[1:]]
+
+        return "\n".join(comment_lines) + f" */\n{key_value}"
+
+    def __eq__(self, other: object) -> bool:
+        """Determine if the supplied object is equal to self
+
+        :param other: The object to compare to self
+
+        :returns: True if they are equal, False otherwise.
+        """
+        if self is other:
+            return True
+
+        if not isinstance(other, DotStringsEntry):
+            return False
+
+        return (
+            self.key == other.key
+            and self.value == other.value
+            and len(self.comments) == len(other.comments)
+            and self.comments == other.comments
+        )
 
-        if len(self.comments) == 2:
-            return f"/* {self.comments[0]}\n   {self.comments[1]} */\n{key_value}"
+    def __ne__(self, other: object) -> bool:
+        """Determine if the supplied object is unequal to self
 
-        output = f"/* {self.comments[0]}\n"
+        :param other: The object to compare to self
 
-        for comment in self.comments[1:-1]:
-            output += f"   {comment}\n"
+        :returns: True if they are unequal, False otherwise.
+        """
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        """Calculate the hash of the object
 
-        output += f"   {self.comments[-1]} */\n{key_value}"
+        The hash is cached the first time it is calculated, so entries should
+        not be mutated once they have been placed in a set or dict.
 
-        return output
+        :returns: The hash value of the object
+        """
+        if self._hash is None:
+            self._hash = hash((self.key, self.value, tuple(self.comments)))
+        return self._hash
 
     def __repr__(self) -> str:
         """Returns a raw representation of the object which can be used to reconstruct it later.
 
         :returns: A raw representation of the object
         """
-        return str({"key": self.key, "value": self.value, "comments": self.comments})
+        return f"{{'key': {self.key!r}, 'value': {self.value!r}, 'comments': {self.comments!r}}}"
 
     def __str__(self) -> str:
         """Generate and return the string representation of the object.
@@ -9,34 +9,54 @@ FORMAT_KEY = "NSStringLocalizedFormatKey"
 VARIABLE_VALUE_SPEC_PLURAL = "NSStringPluralRuleType"
 
 
+def _plural_value_property(category: str) -> property:
+    """Create an accessor property for a single plural category value.
+
+    :param category: The CLDR plural category the property should proxy
+
+    :returns: A property reading and writing `Variable.values`
+    """
+
+    def getter(self: "Variable") -> str | None:
+        return self.values.get(category)
+
+    def setter(self: "Variable", value: str | None) -> None:
+        if value is None:
+            self.values.pop(category, None)
+        else:
+            self.values[category] = value
+
+    return property(getter, setter)
+
+
 class Variable:
     """Represents a .stringsdict entry variable.
 
+    The plural values are held in a single `values` dictionary, keyed by the
+    CLDR plural category (e.g. "zero", "one"). The `*_value` properties remain
+    as convenience accessors onto that dictionary.
+
     :param value_type: Value for NSStringFormatValueTypeKey
-    :param zero_value: Value for zero
-    :param one_value: Value for one
-    :param two_value: Value for two
-    :param few_value: Value for few
-    :param many_value: Value for many
-    :param other_value: Value for other
+    :param values: The values for each plural category
     """
 
+    PLURAL_CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+    __slots__ = ("value_type", "values")
+
     value_type: str | None
-    zero_value: str | None
-    one_value: str | None
-    two_value: str | None
-    few_value: str | None
-    many_value: str | None
-    other_value: str | None
+    values: dict[str, str]
+
+    zero_value = _plural_value_property("zero")
+    one_value = _plural_value_property("one")
+    two_value = _plural_value_property("two")
+    few_value = _plural_value_property("few")
+    many_value = _plural_value_property("many")
+    other_value = _plural_value_property("other")
 
     def __init__(self) -> None:
         self.value_type = None
-        self.zero_value = None
-        self.one_value = None
-        self.two_value = None
-        self.few_value = None
-        self.many_value = None
-        self.other_value = None
+        self.values = {}
 
     @staticmethod
     def parse(contents: dict) -> "Variable":
@@ -63,12 +83,11 @@ class Variable:
 
         variable.value_type = contents[VARIABLE_VALUE_TYPE_KEY]
 
-        variable.zero_value = contents.get("zero")
-        variable.one_value = contents.get("one")
-        variable.two_value = contents.get("two")
-        variable.few_value = contents.get("few")
-        variable.many_value = contents.get("many")
-        variable.other_value = contents.get("other")
+        variable.values = {
+            category: contents[category]
+            for category in Variable.PLURAL_CATEGORIES
+            if category in contents
+        }
 
         return variable
 
@@ -77,17 +96,7 @@ class Variable:
 
         :returns: A raw representation of the object
         """
-        return str(
-            {
-                "value_type": self.value_type,
-                "zero_value": self.zero_value,
-                "one_value": self.one_value,
-                "two_value": self.two_value,
-                "few_value": self.few_value,
-                "many_value": self.many_value,
-                "other_value": self.other_value,
-            }
-        )
+        return str({"value_type": self.value_type, "values": self.values})
 
     def __str__(self) -> str:
         """Generate and return the string representation of the object.
@@ -104,6 +113,8 @@ class DotStringsDictEntry:
     :param value: The value for the entry
     """
 
+    __slots__ = ("key", "value", "variables")
+
     key: str
     value: str
     variables: dict
@@ -125,18 +136,7 @@ class DotStringsDictEntry:
             variable_dict[VARIABLE_VALUE_SPEC_KEY] = VARIABLE_VALUE_SPEC_PLURAL
             if variable.value_type is not None:
                 variable_dict[VARIABLE_VALUE_TYPE_KEY] = variable.value_type
-            if variable.zero_value is not None:
-                variable_dict["zero"] = variable.zero_value
-            if variable.one_value is not None:
-                variable_dict["one"] = variable.one_value
-            if variable.two_value is not None:
-                variable_dict["two"] = variable.two_value
-            if variable.few_value is not None:
-                variable_dict["few"] = variable.few_value
-            if variable.many_value is not None:
-                variable_dict["many"] = variable.many_value
-            if variable.other_value is not None:
-                variable_dict["other"] = variable.other_value
+            variable_dict.update(variable.values)
 
             result[variable_name] = variable_dict
 
@@ -150,12 +150,7 @@ class DotStringsDictEntry:
             another_variable = another.variables.get(key)
             if another_variable is not None:
                 variable.value_type = another_variable.value_type
-                variable.zero_value = another_variable.zero_value
-                variable.one_value = another_variable.one_value
-                variable.two_value = another_variable.two_value
-                variable.few_value = another_variable.few_value
-                variable.many_value = another_variable.many_value
-                variable.other_value = another_variable.other_value
+                variable.values = dict(another_variable.values)
 
     @staticmethod
     def parse(key: str, contents: dict) -> "DotStringsDictEntry":
@@ -1,12 +1,78 @@
 """Wrapper around the genstrings command"""
 
+import concurrent.futures
 import os
-import shutil
 import subprocess
-import tempfile
 
 from dotstrings.exceptions import DotStringsException
 
+# The lowest ARG_MAX of the supported platforms is ~256KiB (macOS). Batches
+# are packed to 7/8 of that so the environment and fixed arguments always fit.
+_MAX_ARGV_BYTES = (256 * 1024) * 7 // 8
+
+
+def _batch_file_paths(file_paths: list[str], base_size: int) -> list[list[str]]:
+    """Pack file paths into batches which fit within the argv size limit.
+
+    :param file_paths: The paths to pack
+    :param base_size: The argv bytes already used by the fixed arguments
+
+    :returns: A list of batches of paths
+    """
+
+    batches = []
+
+    current_batch: list[str] = []
+    current_size = base_size
+
+    for file_path in file_paths:
+        path_size = len(os.fsencode(file_path)) + 1
+
+        if len(current_batch) > 0 and current_size + path_size > _MAX_ARGV_BYTES:
+            batches.append(current_batch)
+            current_batch = []
+            current_size = base_size
+
+        current_batch.append(file_path)
+        current_size += path_size
+
+    if len(current_batch) > 0:
+        batches.append(current_batch)
+
+    return batches
+
+
+def _run_extraction(command: list[str]) -> None:
+    """Run a single extractLocStrings invocation.
+
+    :param command: The full command to run, including the file paths
+
+    :raises Exception: If the command fails or produces any output
+    """
+
+    try:
+        output_bytes = subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ).stdout
+
+        # We decode here rather than in the subprocess call because it seems
+        # that extractLocStrings can occasionally flush its buffer without
+        # writing the entirety of a character out. When that happens, the
+        # text wrapper tries to decode it and fails. By buffering all bytes
+        # until the end of the command and then decoding, we avoid this
+        # issue.
+        output = output_bytes.decode("utf-8", errors="backslashreplace")
+
+        output = output.strip()
+
+        if len(output) > 0:
+            raise DotStringsException(f"Encountered an error generating strings: {output}")
+    except subprocess.CalledProcessError as ex:
+        raise DotStringsException(f"Unable generate .strings files! {ex}") from ex
+
 
 def _convert_to_utf8(file_path: str) -> None:
     """Take a UTF-16 file and convert to UTF-8.
@@ -18,14 +84,16 @@ def _convert_to_utf8(file_path: str) -> None:
     :raises Exception: If we are unable to convert
     """
 
-    temp_file_path = tempfile.mktemp()
-
-    iconv_command = f'iconv -f UTF-16 -t UTF-8 "{file_path}" > "{temp_file_path}"'
+    with open(file_path, "rb") as strings_file:
+        contents = strings_file.read()
 
-    if subprocess.run(iconv_command, shell=True, check=False).returncode != 0:
-        raise DotStringsException("Unable to convert from UTF-16 to UTF-8!")
+    try:
+        text = contents.decode("utf-16")
+    except UnicodeDecodeError as ex:
+        raise DotStringsException("Unable to convert from UTF-16 to UTF-8!") from ex
 
-    shutil.move(temp_file_path, file_path)
+    with open(file_path, "w", encoding="utf-8") as strings_file:
+        strings_file.write(text)
 
 
 def generate_strings(
@@ -66,10 +134,11 @@ def generate_strings(
     english_strings_directory = os.path.join(output_directory, "en.lproj")
 
     # Create output directory
+    directory_existed = os.path.isdir(english_strings_directory)
     os.makedirs(english_strings_directory, exist_ok=True)
 
-    # Empty existing strings
-    if clear_existing:
+    # Empty existing strings (a freshly created folder has nothing to clear)
+    if clear_existing and directory_existed:
         for table in os.listdir(english_strings_directory):
             # Do not clear non .strings files
             if not table.endswith(".strings"):
@@ -80,44 +149,26 @@ def generate_strings(
                 table_file.write("")
 
     # We can't pass in too many files on the command line or the argument list
-    # is too long. To avoid this, we do it in chunks of 100.
-    files_per_iteration = 100
-
-    for i in range(0, (len(file_paths) // files_per_iteration) + 1):
-
-        # Take the next group of files
-        current_files = file_paths[i * files_per_iteration : (i + 1) * files_per_iteration]
-
-        genstrings_command = ["xcrun", "extractLocStrings", "-a", "-noPositionalParameters", "-u"]
-        genstrings_command += ["-o", english_strings_directory]
-        genstrings_command.extend(current_files)
-
-        try:
-            output_bytes = subprocess.run(
-                genstrings_command,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            ).stdout
-
-            # We decode here rather than in the subprocess call because it seems
-            # that extractLocStrings can occasionally flush its buffer without
-            # writing the entirety of a character out. When that happens, the
-            # text wrapper tries to decode it and fails. By buffering all bytes
-            # until the end of the command and then decoding, we avoid this
-            # issue.
-            output = output_bytes.decode("utf-8", errors="backslashreplace")
-
-            output = output.strip()
-
-            if len(output) > 0:
-                raise DotStringsException(f"Encountered an error generating strings: {output}")
-        except subprocess.CalledProcessError as ex:
-            raise DotStringsException(f"Unable generate .strings files! {ex}") from ex
-
-    # Convert all .strings files to UTF-8
-    for file_name in os.listdir(english_strings_directory):
-        file_path = os.path.join(english_strings_directory, file_name)
-        # Check for file type and .strings extension
-        if file_name.endswith(".strings") and os.path.isfile(file_path):
-            _convert_to_utf8(file_path)
+    # is too long. Rather than a fixed count per invocation, pack as many
+    # paths as will fit under the argv byte limit into each one.
+    base_command = ["xcrun", "extractLocStrings", "-a", "-noPositionalParameters", "-u"]
+    base_command += ["-o", english_strings_directory]
+
+    base_size = sum(len(os.fsencode(argument)) + 1 for argument in base_command)
+
+    for current_files in _batch_file_paths(file_paths, base_size):
+        _run_extraction(base_command + current_files)
+
+    # Convert all .strings files to UTF-8. scandir gives us the name, path
+    # and file type in a single pass without a stat call per entry.
+    with os.scandir(english_strings_directory) as folder_entries:
+        generated_paths = [
+            folder_entry.path
+            for folder_entry in folder_entries
+            if folder_entry.name.endswith(".strings") and folder_entry.is_file()
+        ]
+
+    # Each conversion is independent I/O, so run them on a thread pool
+    if len(generated_paths) > 0:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            list(executor.map(_convert_to_utf8, generated_paths))
@@ -14,13 +14,16 @@ class LocalizedBundle:
 
     def __init__(self, raw_entries: dict[str, dict[str, list[LocalizedString]]]) -> None:
         self.raw_entries = raw_entries
+        self._table_names_cache: list[str] | None = None
+        self._tables_cache: dict[bool, dict[str, dict[str, list[LocalizedString]]]] = {}
+        self._table_languages_cache: dict[tuple[str, bool], dict[str, list[LocalizedString]]] = {}
 
     def languages(self) -> list[str]:
         """Return the languages supported in the bundle
 
-        :returns: A list of language codes
+        :returns: A sorted list of language codes
         """
-        return list(self.raw_entries.keys())
+        return sorted(self.raw_entries)
 
     def table_names(self, validate_identical: bool = False) -> list[str]:
         """Return the tables in the bundle.
@@ -28,9 +31,12 @@ class LocalizedBundle:
         :param validate_identical: Set to True to confirm all languages have the
                                    same tables in them
 
-        :returns: A list of table names
+        :returns: A sorted list of table names
         """
 
+        if not validate_identical and self._table_names_cache is not None:
+            return list(self._table_names_cache)
+
         if validate_identical:
 
             # Build up a map of languages to table names
@@ -47,6 +53,11 @@ class LocalizedBundle:
             base_language_tables = found_tables[base_language]
 
             for language, table_names in found_tables.items():
+                # The common case is that the tables match, so check that
+                # cheaply before computing the differences for the error
+                if table_names == base_language_tables:
+                    continue
+
                 extra_tables = table_names - base_language_tables
                 missing_tables = base_language_tables - table_names
 
@@ -62,7 +73,7 @@ class LocalizedBundle:
                         + f" but not in {language}: {missing_tables}"
                     )
 
-            return list(base_language_tables)
+            return sorted(base_language_tables)
 
         all_table_names = set()
 
@@ -70,7 +81,9 @@ class LocalizedBundle:
             for table in table_map.keys():
                 all_table_names.add(table)
 
-        return list(all_table_names)
+        self._table_names_cache = sorted(all_table_names)
+
+        return list(self._table_names_cache)
 
     def tables_for_language(self, language: str) -> dict[str, list[LocalizedString]]:
         """Return the tables for a language.
@@ -95,22 +108,36 @@ class LocalizedBundle:
         :param table: The table to load the data for
         :param bool allow_missing: Set to True to allow a table to be missing for any languages
 
-        :returns: A dictionary of language codes to a list of strings
+        :returns: A dictionary of language codes to a list of strings. The
+                  result is cached, so treat it as read-only.
         """
+        cache_key = (table, allow_missing)
+        cached = self._table_languages_cache.get(cache_key)
+
+        if cached is not None:
+            return cached
+
         results = {}
 
         for language, table_map in self.raw_entries.items():
             sentinel = object()
             table_data = table_map.get(table, sentinel)
 
-            if table_data is sentinel and language == "Base":
-                continue
+            if table_data is sentinel:
+                if language == "Base":
+                    continue
 
-            if table_data is sentinel and not allow_missing:
-                raise DotStringsException(f"Could not find table {table} for language {language}")
+                if not allow_missing:
+                    raise DotStringsException(
+                        f"Could not find table {table} for language {language}"
+                    )
+
+                continue
 
             results[language] = cast(list[LocalizedString], table_data)
 
+        self._table_languages_cache[cache_key] = results
+
         return results
 
     def tables(
@@ -135,14 +162,33 @@ class LocalizedBundle:
         }
         ```
 
-        :returns: A dictionary of table names to a dictionary of languages to strings
+        :returns: A dictionary of table names to a dictionary of languages to
+                  strings. The result is cached, so treat it as read-only.
         """
-        results = {}
+        cached = self._tables_cache.get(validate_missing)
 
-        for table_name in self.table_names():
-            results[table_name] = self.table_for_languages(
-                table_name, allow_missing=(not validate_missing)
-            )
+        if cached is not None:
+            return cached
+
+        results: dict[str, dict[str, list[LocalizedString]]] = {}
+
+        # Transpose the language -> table map in a single pass rather than
+        # re-scanning every language once per table
+        for language, table_map in self.raw_entries.items():
+            for table_name, strings in table_map.items():
+                results.setdefault(table_name, {})[language] = strings
+
+        if validate_missing:
+            for table_name, languages in results.items():
+                for language in self.raw_entries:
+                    if language == "Base":
+                        continue
+                    if language not in languages:
+                        raise DotStringsException(
+                            f"Could not find table {table_name} for language {language}"
+                        )
+
+        self._tables_cache[validate_missing] = results
 
         return results
 
@@ -156,8 +202,23 @@ class LocalizedBundle:
         :raises Exception: If the other bundle has identical tables
         """
 
+        # Check for collisions up front so a failed merge leaves this bundle
+        # untouched
         for language, table_map in other.raw_entries.items():
+            existing_tables = self.raw_entries.get(language)
+            if existing_tables is None:
+                continue
+            for table in table_map:
+                if table in existing_tables:
+                    raise DotStringsException(
+                        f"Cannot merge bundles: table {table} already exists for language {language}"
+                    )
+
+        for language, table_map in other.raw_entries.items():
+            language_tables = self.raw_entries.setdefault(language, {})
             for table, strings in table_map.items():
-                if self.raw_entries.get(language) is None:
-                    self.raw_entries[language] = {}
-                self.raw_entries[language][table] = strings
+                language_tables[table] = strings
+
+        self._table_names_cache = None
+        self._tables_cache.clear()
+        self._table_languages_cache.clear()
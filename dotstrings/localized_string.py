@@ -1,14 +1,16 @@
 """Localized string types"""
 
+import functools
 import hashlib
 import re
-from typing import ClassVar, Pattern
+import sys
+from typing import ClassVar, Iterator, Pattern
 
 from dotstrings.dot_strings_entry import DotStringsEntry
 from dotstrings.exceptions import DotStringsException
 
 
-class LocalizedString:
+class LocalizedString:  # pylint: disable=too-many-instance-attributes
     """Represents a localized string.
 
     Note: Automatic key generation is supported. By this, if you pass None as
@@ -39,6 +41,24 @@ class LocalizedString:
     )
     _TOKEN_PATTERN: ClassVar[Pattern] = re.compile(_TOKEN_REGEX, flags=re.DOTALL)
 
+    _ESCAPE_PATTERN: ClassVar[Pattern] = re.compile(r'\\([n"])')
+    _ESCAPE_VALUES: ClassVar[dict[str, str]] = {"n": "\n", '"': '"'}
+
+    # Bound once so _calculate_key doesn't re-resolve the hashlib constructor
+    # and digest size on every call
+    _KEY_HASHER: ClassVar = functools.partial(hashlib.blake2b, digest_size=16)
+
+    __slots__ = (
+        "key",
+        "value",
+        "language",
+        "table",
+        "comment",
+        "key_extension",
+        "bundle",
+        "_hash",
+    )
+
     key: str
     value: str
     language: str
@@ -46,6 +66,7 @@ class LocalizedString:
     comment: str | None
     key_extension: str | None
     bundle: str
+    _hash: int | None
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -59,12 +80,16 @@ class LocalizedString:
         key_extension: str | None = None,
         bundle: str = "",
     ) -> None:
+        # The language, table, bundle and comment values repeat across every
+        # string parsed from the same file, so intern them to share a single
+        # copy of each
         self.value = value
-        self.language = language
-        self.comment = comment
+        self.language = sys.intern(language)
+        self.comment = sys.intern(comment) if comment is not None else None
         self.key_extension = key_extension
-        self.table = table
-        self.bundle = bundle
+        self.table = sys.intern(table)
+        self.bundle = sys.intern(bundle)
+        self._hash = None
 
         if key is not None:
             self.key = key
@@ -84,25 +109,41 @@ class LocalizedString:
         :returns: The unique key for the string
         """
 
-        # Calculate key based on string interpreted by the compiler
-        hash_input = value
+        # Calculate key based on string interpreted by the compiler. Replace
+        # "slash n"/"slash quote" escapes with the characters the compiler
+        # would produce, in a single pass over the string.
+        def unescaped(part: str) -> bytes:
+            return LocalizedString._ESCAPE_PATTERN.sub(
+                lambda match: LocalizedString._ESCAPE_VALUES[match.group(1)], part
+            ).encode("utf-8")
+
+        # An escape can't span the ":" separator, so each part can be fed to
+        # the hash on its own rather than concatenating them first
+        hasher = LocalizedString._KEY_HASHER()
+        hasher.update(unescaped(value))
 
         if key_extension is not None:
-            hash_input += ":" + key_extension
+            hasher.update(b":")
+            hasher.update(unescaped(key_extension))
 
-        hash_input = hash_input.replace("\\n", "\n")  # Replace "slash n" with newline character
-        hash_input = hash_input.replace('\\"', '"')  # Replace "slash quote" with quote character
+        return hasher.hexdigest()
 
-        key = hashlib.md5(hash_input.encode("utf-8")).hexdigest()
+    def token_iter(self) -> Iterator[str]:
+        """Iterate over the tokens in the string.
 
-        return key
+        Prefer this over `tokens` when the tokens are only iterated or counted
+        once, as it avoids building the intermediate list.
+
+        :returns: An iterator over the tokens in the string
+        """
+        return (match.group(0) for match in LocalizedString._TOKEN_PATTERN.finditer(self.value))
 
     def tokens(self) -> list[str]:
         """Find and return the tokens in the string.
 
         :returns: The list of tokens in the string
         """
-        return LocalizedString._TOKEN_PATTERN.findall(self.value)
+        return list(self.token_iter())
 
     def ns_localized_format(self) -> str:
         """Return the NSLocalizedString version of our call.
@@ -125,17 +166,28 @@ class LocalizedString:
 
         :returns: True if they are equal, False otherwise.
         """
+        if self is other:
+            return True
+
         if not isinstance(other, LocalizedString):
             return False
 
+        # If both sides already computed their hashes and they differ, the
+        # strings can't be equal — skip the field comparisons entirely
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+
+        # Compare the key first: it is short (and interned when parsed), so
+        # unequal strings usually bail out before the longer value/comment
+        # comparisons run
         return (
-            self.value == other.value
+            self.key == other.key
             and self.language == other.language
-            and self.comment == other.comment
-            and self.key_extension == other.key_extension
             and self.table == other.table
             and self.bundle == other.bundle
-            and self.key == other.key
+            and self.key_extension == other.key_extension
+            and self.value == other.value
+            and self.comment == other.comment
         )
 
     def __ne__(self, other: object) -> bool:
@@ -150,35 +202,34 @@ class LocalizedString:
     def __hash__(self) -> int:
         """Calculate the hash of the object
 
+        The hash is cached the first time it is calculated, so strings should
+        not be mutated once they have been placed in a set or dict.
+
         :returns: The hash value of the object
         """
-        return hash(
-            (
-                self.value,
-                self.language,
-                self.comment,
-                self.key_extension,
-                self.table,
-                self.bundle,
-                self.key,
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.value,
+                    self.language,
+                    self.comment,
+                    self.key_extension,
+                    self.table,
+                    self.bundle,
+                    self.key,
+                )
             )
-        )
+        return self._hash
 
     def __repr__(self) -> str:
         """Returns a raw representation of the object which can be used to reconstruct it later.
 
         :returns: A raw representation of the object
         """
-        return str(
-            {
-                "key": self.key,
-                "value": self.value,
-                "language": self.language,
-                "table": self.table,
-                "comment": self.comment,
-                "bundle": self.bundle,
-                "key_extension": self.key_extension,
-            }
+        return (
+            f"{{'key': {self.key!r}, 'value': {self.value!r}, 'language': {self.language!r}, "
+            + f"'table': {self.table!r}, 'comment': {self.comment!r}, 'bundle': {self.bundle!r}, "
+            + f"'key_extension': {self.key_extension!r}}}"
         )
 
     def __str__(self) -> str:
@@ -201,10 +252,8 @@ class LocalizedString:
         :returns: A list of LocalizedStrings
         """
 
-        output = []
-
-        for entry in entries:
-            localized = LocalizedString(
+        return [
+            LocalizedString(
                 key=entry.key,
                 value=entry.value,
                 language=language,
@@ -213,6 +262,5 @@ class LocalizedString:
                 key_extension=None,
                 bundle="",
             )
-            output.append(localized)
-
-        return output
+            for entry in entries
+        ]
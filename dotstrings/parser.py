@@ -1,5 +1,7 @@
 """Utilities for dealing with .strings files"""
 
+import functools
+import os
 import plistlib
 import re
 from typing import BinaryIO, Pattern, TextIO
@@ -14,7 +16,7 @@ class Patterns:
 
     comment = re.compile(r"(\'(?:[^\'\\]|\\[\s\S])*\')|//.*|/\*(?:[^*]|\*(?!/))*\*/", re.MULTILINE)
     whitespace = re.compile(r"\s*", re.MULTILINE)
-    entry = re.compile(r'"(.*)"\s*=\s*"(.*)";')
+    entry = re.compile(r'"((?:[^"\\]|\\.)*)"\s*=\s*"((?:[^"\\]|\\.)*)";')
 
 
 class Scanner:
@@ -34,13 +36,13 @@ class Scanner:
         """
         return self.offset < len(self.string)
 
-    def scan(self, pattern: str | Pattern, flags: int = 0) -> str | None:
-        """Scan a string for a pattern and return the string if found.
+    def scan_match(self, pattern: str | Pattern, flags: int = 0) -> re.Match | None:
+        """Scan a string for a pattern and return the match if found.
 
         :param pattern: The pattern to scan for
         :param flags: Any flags to use for a string pattern
 
-        :returns: The string if the pattern matches, None otherwise.
+        :returns: The match if the pattern matches, None otherwise.
         """
 
         if isinstance(pattern, str):
@@ -52,26 +54,46 @@ class Scanner:
 
         if match is not None:
             self.offset = match.end()
+
+        return match
+
+    def scan(self, pattern: str | Pattern, flags: int = 0) -> str | None:
+        """Scan a string for a pattern and return the string if found.
+
+        :param pattern: The pattern to scan for
+        :param flags: Any flags to use for a string pattern
+
+        :returns: The string if the pattern matches, None otherwise.
+        """
+
+        match = self.scan_match(pattern, flags)
+
+        if match is not None:
             return match.group(0)
 
         return None
 
 
-def load(file_details: TextIO | str, encoding: str | None = None) -> list[DotStringsEntry]:
-    """Parse the contents of a .strings file from a file pointer.
+# pylint: disable=unused-argument
+@functools.lru_cache(maxsize=256)
+def _load_cached(
+    path: str, encoding: str | None, mtime_ns: int, size: int
+) -> tuple[DotStringsEntry, ...]:
+    """Parse a .strings file, caching the result on the file's identity.
 
-    :param file_details: The file pointer or a file path
+    The mtime and size arguments exist purely to key the cache; a file which
+    has changed on disk produces a fresh cache entry.
+
+    :param path: The path of the file to parse
     :param encoding: The encoding the file is in
+    :param mtime_ns: The modification time of the file (in nanoseconds)
+    :param size: The size of the file (in bytes)
 
-    :returns: A list of `DotStringEntry`s
-    """
+    :returns: A tuple of `DotStringsEntry`s
 
-    # If it's a file pointer, read in the contents and parse
-    if not isinstance(file_details, str):
-        contents = "".join(file_details.readlines())
-        return loads(contents)
+    :raises DotStringsException: If the encoding could not be determined
+    """
 
-    # It must have been a path instead then, so open the file, and parse
     if encoding:
         encoding_list = [encoding]
     else:
@@ -79,12 +101,37 @@ def load(file_details: TextIO | str, encoding: str | None = None) -> list[DotStr
 
     for encoding_option in encoding_list:
         try:
-            with open(file_details, "r", encoding=encoding_option) as strings_file:
-                return load(strings_file)
+            with open(path, "r", encoding=encoding_option) as strings_file:
+                return tuple(load(strings_file))
         except UnicodeDecodeError:
             pass
 
-    raise DotStringsException(f"Could not determine encoding for file at path: {file_details}")
+    raise DotStringsException(f"Could not determine encoding for file at path: {path}")
+
+
+# pylint: enable=unused-argument
+
+
+def load(file_details: TextIO | str, encoding: str | None = None) -> list[DotStringsEntry]:
+    """Parse the contents of a .strings file from a file pointer.
+
+    :param file_details: The file pointer or a file path
+    :param encoding: The encoding the file is in
+
+    :returns: A list of `DotStringEntry`s
+    """
+
+    # If it's a file pointer, read in the contents and parse
+    if not isinstance(file_details, str):
+        return loads(file_details.read())
+
+    # It must have been a path instead then, so parse via the cache. The
+    # cached entries are mutable, so hand each caller their own copies rather
+    # than sharing the cached ones.
+    stat_result = os.stat(file_details)
+    entries = _load_cached(file_details, encoding, stat_result.st_mtime_ns, stat_result.st_size)
+
+    return [DotStringsEntry(entry.key, entry.value, list(entry.comments)) for entry in entries]
 
 
 def loads(contents: str) -> list[DotStringsEntry]:
@@ -111,7 +158,7 @@ def loads(contents: str) -> list[DotStringsEntry]:
         # Clear any whitespace
         _ = scanner.scan(Patterns.whitespace)
 
-        comments = []
+        comments: list[str] = []
 
         # Get any comment
         while True:
@@ -123,35 +170,29 @@ def loads(contents: str) -> list[DotStringsEntry]:
 
             # Clear out the comment syntax
             if comment.startswith("//"):
-                comment = comment.replace("//", "", 1)
+                comment = comment.removeprefix("//")
             elif comment.startswith("/*"):
-                comment = comment.replace("/*", "", 1)
-                comment = comment[::-1].replace("/*", "", 1)[::-1]
+                comment = comment.removeprefix("/*").removesuffix("*/")
 
             comment = comment.strip()
 
             # Split any multi-line comments
-            components = [c.strip() for c in comment.split("\n")]
-            comments.extend(components)
+            comments.extend(component.strip() for component in comment.splitlines())
 
             # Pull out any whitespace
             _ = scanner.scan(Patterns.whitespace)
 
         # Get the entry line
-        entry = scanner.scan(Patterns.entry)
+        entry_match = scanner.scan_match(Patterns.entry)
 
-        if entry is None:
+        if entry_match is None:
             if scanner.has_more():
                 raise DotStringsException(f"Expected an entry at offset {scanner.offset}")
             break
 
         # Now extract the key and value
-        entry_matches = Patterns.entry.search(entry)
-        if not entry_matches:
-            raise DotStringsException(f"Failed to parse entry at offset {scanner.offset}")
-
-        key = entry_matches.group(1)
-        value = entry_matches.group(2)
+        key = entry_match.group(1)
+        value = entry_match.group(2)
 
         strings.append(DotStringsEntry(key, value, comments))
 
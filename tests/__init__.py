@@ -0,0 +1,7 @@
+"""Tests for the dotstrings package."""
+
+import os
+import sys
+
+# Make sure the checkout being tested is imported, not an installed copy
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__), "..", "..")))
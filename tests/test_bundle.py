@@ -3,32 +3,49 @@
 # pylint: disable=line-too-long
 
 import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__), "..", "..")))
 import dotstrings
 
 
 class BundleTests(unittest.TestCase):
     """Bundle tests."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         current_file_path = os.path.abspath(__file__)
         current_folder_path = os.path.dirname(current_file_path)
-        self.bundle_path = os.path.abspath(os.path.join(current_folder_path, "string_bundle"))
-        self.bundle2_path = os.path.abspath(os.path.join(current_folder_path, "string_bundle2"))
+        cls.bundle_path = os.path.abspath(os.path.join(current_folder_path, "string_bundle"))
+        cls.bundle2_path = os.path.abspath(os.path.join(current_folder_path, "string_bundle2"))
 
     def test_load_all(self):
         """Test that an entire bundle loads."""
         strings = dotstrings.load_all_strings(self.bundle_path).raw_entries
-        self.assertEqual(["en", "fr"], sorted(list(strings.keys())))
+        self.assertEqual(["en", "fr"], sorted(strings))
 
         english_strings = strings["en"]
-        self.assertEqual(["One", "Two"], sorted(list(english_strings.keys())))
+        self.assertEqual(["One", "Two"], sorted(english_strings))
 
         french_strings = strings["fr"]
-        self.assertEqual(["One", "Two"], sorted(list(french_strings.keys())))
+        self.assertEqual(["One", "Two"], sorted(french_strings))
+
+    def test_load_language_tables(self):
+        """Test that language tables list without parsing and load on demand."""
+        tables = dotstrings.load_language_tables(self.bundle_path, "en")
+        assert isinstance(tables, dotstrings.LazyTables)
+
+        # Listing the tables should not parse anything
+        self.assertEqual(sorted(tables), ["One", "Two"])
+        self.assertEqual(len(tables), 2)
+        self.assertEqual(tables._loaded, {})  # pylint: disable=protected-access
+
+        # Tables parse on first access and are cached after that
+        table_one = tables["One"]
+        self.assertEqual(len(table_one), 2)
+        self.assertIs(table_one, tables["One"])
+
+        with self.assertRaises(KeyError):
+            _ = tables["Missing"]
 
     def test_localized_bundle_languages(self):
         """Test that the languages call in localized bundles works."""
@@ -45,15 +62,15 @@ class BundleTests(unittest.TestCase):
         """Test that the tables call in localized bundles works."""
         strings = dotstrings.load_all_strings(self.bundle_path)
         tables = strings.tables()
-        self.assertEqual(sorted(list(tables.keys())), ["One", "Two"])
+        self.assertEqual(sorted(tables), ["One", "Two"])
 
         table_one = tables["One"]
-        self.assertEqual(sorted(list(table_one.keys())), ["en", "fr"])
+        self.assertEqual(sorted(table_one), ["en", "fr"])
         self.assertEqual(len(table_one["en"]), 2)
         self.assertEqual(len(table_one["fr"]), 2)
 
         table_two = tables["Two"]
-        self.assertEqual(sorted(list(table_two.keys())), ["en", "fr"])
+        self.assertEqual(sorted(table_two), ["en", "fr"])
         self.assertEqual(len(table_two["en"]), 1)
         self.assertEqual(len(table_two["fr"]), 1)
 
@@ -68,7 +85,7 @@ class BundleTests(unittest.TestCase):
         strings = dotstrings.load_all_strings(self.bundle_path)
 
         one_languages = strings.table_for_languages("One")
-        self.assertEqual(sorted(list(one_languages.keys())), ["en", "fr"])
+        self.assertEqual(sorted(one_languages), ["en", "fr"])
 
         one_english = one_languages["en"]
         self.assertEqual(len(one_english), 2)
@@ -77,7 +94,7 @@ class BundleTests(unittest.TestCase):
         self.assertEqual(len(one_french), 2)
 
         two_languages = strings.table_for_languages("Two")
-        self.assertEqual(sorted(list(two_languages.keys())), ["en", "fr"])
+        self.assertEqual(sorted(two_languages), ["en", "fr"])
 
         two_english = two_languages["en"]
         self.assertEqual(len(two_english), 1)
@@ -92,10 +109,10 @@ class BundleTests(unittest.TestCase):
 
         bundle.merge_bundle(bundle2)
 
-        self.assertEqual(["en", "fr"], sorted(list(bundle.raw_entries.keys())))
+        self.assertEqual(["en", "fr"], sorted(bundle.raw_entries))
 
         english_strings = bundle.raw_entries["en"]
-        self.assertEqual(sorted(["One", "Two", "Three"]), sorted(list(english_strings.keys())))
+        self.assertEqual(sorted(["One", "Two", "Three"]), sorted(english_strings))
 
         french_strings = bundle.raw_entries["fr"]
-        self.assertEqual(sorted(["One", "Two", "Three"]), sorted(list(french_strings.keys())))
+        self.assertEqual(sorted(["One", "Two", "Three"]), sorted(french_strings))
@@ -3,21 +3,20 @@
 # pylint: disable=line-too-long
 
 import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.abspath(__file__), "..", "..")))
 import dotstrings
 
 
 class SimpleTests(unittest.TestCase):
     """Simple tests."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         current_file_path = os.path.abspath(__file__)
         current_folder_path = os.path.dirname(current_file_path)
-        self.strings_path = os.path.abspath(os.path.join(current_folder_path, "strings_files"))
-        self.stringsdict_path = os.path.abspath(os.path.join(current_folder_path, "stringsdict_files"))
+        cls.strings_path = os.path.abspath(os.path.join(current_folder_path, "strings_files"))
+        cls.stringsdict_path = os.path.abspath(os.path.join(current_folder_path, "stringsdict_files"))
 
     def test_single_string(self):
         """Test that a single string load works."""